@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from typing import List, Optional, Any
+from typing import FrozenSet, List, Optional, Any
 from .lexer import TokenType
 
 class ASTNode:
@@ -46,6 +46,12 @@ class PostfixOp(Expression):
         self.operand = operand
         self.op = op
 
+class MembershipTest(Expression):
+    # `x == c1 || x == c2 || ...` folded into a single set lookup
+    def __init__(self, operand: Identifier, values: FrozenSet[int]):
+        self.operand = operand
+        self.values = values
+
 class Assignment(Statement):
     def __init__(self, target: Expression, value: Expression, op: TokenType = TokenType.ASSIGN):
         self.target = target
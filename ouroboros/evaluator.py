@@ -3,6 +3,7 @@
 from typing import Any, Dict
 from .lexer import TokenType
 from .ast_nodes import *
+from .matrix import Matrix
 from .errors import RuntimeError
 
 class Evaluator:
@@ -11,6 +12,7 @@ class Evaluator:
         self.functions = functions
         self.stdlib = stdlib
         self.interpreter = interpreter
+        self.read_memory = interpreter.memory_manager.read_memory
     
     def get_variable(self, name: str) -> Any:
         return self.interpreter.get_variable(name)
@@ -35,21 +37,16 @@ class Evaluator:
             return self.evaluate_function_call(node)
         
         elif isinstance(node, ArrayAccess):
-            array = self.evaluate(node.array)
-            index = self.evaluate(node.index)
-            
-            if isinstance(array, int) and hasattr(self.interpreter, 'memory_manager'):
-                try:
-                    return self.interpreter.memory_manager.read_memory(array, int(index))
-                except Exception as e:
-                    raise RuntimeError(f"Memory access error: {e}")
-            elif isinstance(array, list):
-                return array[int(index)]
-            elif hasattr(array, '__getitem__'):
-                # Handle Matrix and other custom types
-                return array[int(index)]
+            if isinstance(node.array, ArrayAccess):
+                base = self.evaluate(node.array.array)
+                if isinstance(base, Matrix):
+                    # matrix[i][j]: index the flat data directly
+                    row = self.evaluate(node.array.index)
+                    return base.get(int(row), int(self.evaluate(node.index)))
+                array = self.index_value(base, self.evaluate(node.array.index))
             else:
-                raise RuntimeError(f"Cannot index non-array value: {type(array)}")
+                array = self.evaluate(node.array)
+            return self.index_value(array, self.evaluate(node.index))
         
         elif isinstance(node, Assignment):
             return self.interpreter.execute_assignment(node)
@@ -60,9 +57,31 @@ class Evaluator:
         elif isinstance(node, PostfixOp):
             return self.evaluate_postfix_op(node)
         
+        elif isinstance(node, MembershipTest):
+            value = self.evaluate(node.operand)
+            try:
+                return 1 if value in node.values else 0
+            except TypeError:
+                # unhashable values (arrays) never equal an integer constant
+                return 0
+        
         else:
             raise RuntimeError(f"Unknown expression type: {type(node)}")
     
+    def index_value(self, array: Any, index: Any) -> Any:
+        if isinstance(array, int):
+            try:
+                return self.read_memory(array, int(index))
+            except Exception as e:
+                raise RuntimeError(f"Memory access error: {e}")
+        elif isinstance(array, list):
+            return array[int(index)]
+        elif hasattr(array, '__getitem__'):
+            # Handle Matrix and other custom types
+            return array[int(index)]
+        else:
+            raise RuntimeError(f"Cannot index non-array value: {type(array)}")
+    
     def evaluate_binary_op(self, node: BinaryOp) -> Any:
         left = self.evaluate(node.left)
         
@@ -124,9 +143,9 @@ class Evaluator:
             return 1 if not self.evaluate(operand) else 0
         elif node.op == TokenType.DEREFERENCE:
             address = self.evaluate(operand)
-            if isinstance(address, int) and hasattr(self.interpreter, 'memory_manager'):
+            if isinstance(address, int):
                 try:
-                    return self.interpreter.memory_manager.read_memory(address, 0)
+                    return self.read_memory(address, 0)
                 except Exception as e:
                     raise RuntimeError(f"Dereference error: {e}")
             else:
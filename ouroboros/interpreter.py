@@ -40,9 +40,18 @@ class OuroborosInterpreter:
         self.local_variables: List[Dict[str, Any]] = []
         self.functions: Dict[str, Function] = {}
         self.memory_manager = MemoryManager()
+        self.write_memory = self.memory_manager.write_memory
         self.stdlib = StandardLibrary(self.memory_manager)
         self.evaluator = None
     
+    def reset(self):
+        """Discard all program state so the interpreter can run a new program"""
+        self.global_variables.clear()
+        self.local_variables.clear()
+        self.functions.clear()
+        self.memory_manager.reset()
+        self.evaluator = None
+    
     def get_variables(self) -> Dict[str, Any]:
         if self.local_variables:
             return self.local_variables[-1]
@@ -227,12 +236,21 @@ class OuroborosInterpreter:
             return self.get_variable(node.target.name)
         
         elif isinstance(node.target, ArrayAccess):
-            array = self.evaluator.evaluate(node.target.array)
+            if isinstance(node.target.array, ArrayAccess):
+                base = self.evaluator.evaluate(node.target.array.array)
+                if isinstance(base, Matrix):
+                    # matrix[i][j] = value: write the flat data directly
+                    row = self.evaluator.evaluate(node.target.array.index)
+                    base.set(int(row), int(self.evaluator.evaluate(node.target.index)), value)
+                    return value
+                array = self.evaluator.index_value(base, self.evaluator.evaluate(node.target.array.index))
+            else:
+                array = self.evaluator.evaluate(node.target.array)
             index = self.evaluator.evaluate(node.target.index)
             
-            if isinstance(array, int) and hasattr(self, 'memory_manager'):
+            if isinstance(array, int):
                 try:
-                    self.memory_manager.write_memory(array, int(index), value)
+                    self.write_memory(array, int(index), value)
                     return value
                 except Exception as e:
                     raise RuntimeError(f"Memory write error: {e}")
@@ -315,22 +333,33 @@ class OuroborosInterpreter:
         
         return None
     
-    def interpret(self, text: str) -> List[Any]:
+    def parse(self, text: str) -> Program:
         lexer = Lexer(text)
         parser = Parser(lexer)
-        ast = parser.parse()
-        
+        return parser.parse()
+    
+    def execute(self, ast: Program) -> List[Any]:
         self.evaluator = Evaluator(self.global_variables, self.functions, self.stdlib, self)
         
         results = []
-        for statement in ast.statements:
-            try:
-                result = self.execute_statement(statement)
-                if result is not None:
-                    results.append(result)
-            except (BreakException, ContinueException, ReturnException) as e:
-                if isinstance(e, ReturnException):
-                    results.append(e.value)
-                break
-        
-        return results
\ No newline at end of file
+        buffer_output = self.stdlib.buffer_output
+        self.stdlib.buffer_output = True
+        try:
+            for statement in ast.statements:
+                try:
+                    result = self.execute_statement(statement)
+                    if result is not None:
+                        results.append(result)
+                except (BreakException, ContinueException, ReturnException) as e:
+                    if isinstance(e, ReturnException):
+                        results.append(e.value)
+                    break
+        finally:
+            # Program output is written once per run, even if it fails
+            self.stdlib.buffer_output = buffer_output
+            self.stdlib.flush_output()
+        
+        return results
+    
+    def interpret(self, text: str) -> List[Any]:
+        return self.execute(self.parse(text))
\ No newline at end of file
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
+import atexit
+import codecs
+import io
+import os
 import shutil
+import sys
 
 class LogLevel(Enum):
     PRINT = "PRINT"
@@ -36,6 +41,9 @@ class Logger:
     _instance = None
     _log_level: LogLevel = LogLevel.DEBUG
     _enabled: bool = True
+    _buffer: List[str] = []
+    _buffered_size: int = 0
+    _buffer_limit: int = 65536
     
     def __new__(cls):
         if cls._instance is None:
@@ -52,6 +60,61 @@ class Logger:
         """ Set activation of logger """
         cls._enabled = enabled
     
+    @classmethod
+    def _write(cls, text: str):
+        """ Queue text for stdout, flushing once the buffer limit is reached """
+        cls._buffer.append(text)
+        cls._buffered_size += len(text)
+        if cls._buffered_size >= cls._buffer_limit:
+            cls.flush()
+    
+    @classmethod
+    def flush(cls):
+        """ Write all queued text to stdout in a single call """
+        if cls._buffer:
+            sys.stdout.write("".join(cls._buffer))
+            cls._buffer.clear()
+            cls._buffered_size = 0
+        sys.stdout.flush()
+    
+    @classmethod
+    def write_raw(cls, text: str):
+        """ Write text straight to the stdout file descriptor when it is UTF-8 """
+        if not cls._should_log(LogLevel.PRINT):
+            return
+        
+        encoding = getattr(sys.stdout, 'encoding', None)
+        try:
+            fd = sys.stdout.fileno()
+            is_utf8 = encoding is not None and codecs.lookup(encoding).name == 'utf-8'
+        except (AttributeError, LookupError, io.UnsupportedOperation):
+            # Not backed by a file descriptor (e.g. redirected to StringIO)
+            is_utf8 = False
+        
+        if not is_utf8:
+            # Let sys.stdout apply its own encoding, like every other line
+            cls._write(text)
+            return
+        
+        cls.flush()
+        view = memoryview(text.encode('utf-8'))
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    
+    @classmethod
+    def print_raw(cls, message: str):
+        """ Print a normal log straight to the stdout file descriptor """
+        if cls._should_log(LogLevel.PRINT):
+            formatted_msg = cls._format_message(LogLevel.PRINT, message)
+            cls.write_raw(formatted_msg + "\n")
+    
+    @classmethod
+    def input(cls, prompt: str = "") -> str:
+        """ Flush queued output and read a line from the user """
+        cls.flush()
+        return input(prompt)
+    
     @classmethod
     def _should_log(cls, level: LogLevel) -> bool:
         """ Format message to log """
@@ -91,74 +154,86 @@ class Logger:
         """ Print a normal log """
         if cls._should_log(LogLevel.PRINT):
             formatted_msg = cls._format_message(LogLevel.PRINT, message)
-            print(formatted_msg)
+            cls._write(formatted_msg + "\n")
     
     @classmethod
     def debug(cls, message: str, **kwargs):
         """ Print a debug log """
         if cls._should_log(LogLevel.DEBUG):
             formatted_msg = cls._format_message(LogLevel.DEBUG, message)
-            print(formatted_msg)
+            cls._write(formatted_msg + "\n")
     
     @classmethod
     def info(cls, message: str, **kwargs):
         """ Print a info log """
         if cls._should_log(LogLevel.INFO):
             formatted_msg = cls._format_message(LogLevel.INFO, message)
-            print(formatted_msg)
+            cls._write(formatted_msg + "\n")
     
     @classmethod
     def warning(cls, message: str, **kwargs):
         """ Print a warning log """
         if cls._should_log(LogLevel.WARNING):
             formatted_msg = cls._format_message(LogLevel.WARNING, message)
-            print(formatted_msg)
+            cls._write(formatted_msg + "\n")
     
     @classmethod
     def error(cls, message: str, **kwargs):
         """ Print a error log """
         if cls._should_log(LogLevel.ERROR):
             formatted_msg = cls._format_message(LogLevel.ERROR, message)
-            print(formatted_msg)
+            cls._write(formatted_msg + "\n")
     
     @classmethod
     def section_start(cls, title: str):
         """ Print a divider for start of section """
         if cls._should_log(LogLevel.INFO):
-            print(f"\n{Style.BOLD}{Style.GREEN}--- {title} ---{Style.RESET}")
+            cls._write(f"\n{Style.BOLD}{Style.GREEN}--- {title} ---{Style.RESET}\n")
     
     @classmethod
     def section_end(cls, title: str):
         """ Print a divider for end of section """
         if cls._should_log(LogLevel.INFO):
-            print(f"{Style.BOLD}{Style.GREEN}--- {title} ---{Style.RESET}\n")
+            cls._write(f"{Style.BOLD}{Style.GREEN}--- {title} ---{Style.RESET}\n\n")
+        cls.flush()
     
     @classmethod
     def header(cls, title: str):
         """ Print a header """
         if cls._should_log(LogLevel.INFO):
-            print(f"\n{Style.BOLD}{Style.BLUE}=== {title} ==={Style.RESET}")
+            cls._write(f"\n{Style.BOLD}{Style.BLUE}=== {title} ==={Style.RESET}\n")
     
     @classmethod
-    def divider(cls, title: str = ""):
-        """ Print a divider """
+    def _divider_line(cls, title: str = "") -> str:
+        """ Format a divider line fitted to the terminal width """
         length = shutil.get_terminal_size().columns
         
-        print("")
         if title:
             remaining_length = length - len(title) - 2
             if remaining_length > 0:
-                print(f"{title} {'-' * remaining_length}")
-            else:
-                print(title)
-        else:
-            print("-" * length)
-        print("")
+                return f"{title} {'-' * remaining_length}"
+            return title
+        return "-" * length
+    
+    @classmethod
+    def divider(cls, title: str = ""):
+        """ Print a divider """
+        cls._write(f"\n{cls._divider_line(title)}\n\n")
+        cls.flush()
+    
+    @classmethod
+    def block(cls, title: str, body: str):
+        """ Print a titled divider followed by a body of text """
+        text = f"\n{cls._divider_line(title)}\n\n"
+        if cls._should_log(LogLevel.PRINT):
+            text += cls._format_message(LogLevel.PRINT, body) + "\n"
+        cls._write(text)
+        cls.flush()
 
     @classmethod
     def marker(cls):
         """ Print a marker """
-        print(f"\n-*-*-*-*-*-\n")
+        cls._write(f"\n-*-*-*-*-*-\n\n")
     
     @classmethod
     def title(cls):
@@ -185,7 +260,10 @@ class Logger:
         console_width = shutil.get_terminal_size().columns
 
         if console_width >= required_width:
-            print(f"{Style.BOLD}{Style.MAGENTA}{package_title}{Style.RESET}")
-            print(f"{Style.MAGENTA}{package_subtitle}{Style.RESET}")
+            cls._write(f"{Style.BOLD}{Style.MAGENTA}{package_title}{Style.RESET}\n")
+            cls._write(f"{Style.MAGENTA}{package_subtitle}{Style.RESET}\n")
         else:
-            print("Ouroboros")
+            cls._write("Ouroboros\n")
+
+
+atexit.register(Logger.flush)
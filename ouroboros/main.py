@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 
 import sys
+import threading
+from functools import lru_cache
 from .interpreter import OuroborosInterpreter
+from .lexer import Lexer
+from .parser import Parser
+from .ast_nodes import Program
 from .errors import InterpreterError
 from .logger import Logger
 
@@ -13,7 +18,7 @@ def main():
     filename = sys.argv[1]
     
     try:
-        with open(filename, 'r') as f:
+        with open(filename, 'r', encoding='utf-8', buffering=32768) as f:
             code = f.read()
         
         interpreter = OuroborosInterpreter()
@@ -33,14 +38,32 @@ def main():
         Logger.error(f"Unexpected error: {e}")
         sys.exit(1)
 
+_local = threading.local()
+
+def _get_interpreter() -> OuroborosInterpreter:
+    """This thread's interpreter, wiped clean for the next program"""
+    interpreter = getattr(_local, 'interpreter', None)
+    if interpreter is None:
+        interpreter = _local.interpreter = OuroborosInterpreter()
+    else:
+        interpreter.reset()
+    return interpreter
+
+@lru_cache(maxsize=128)
+def _compile(code: str) -> Program:
+    """Parse code once; feeding the same source again reuses the AST"""
+    return Parser(Lexer(code)).parse()
+
 def feed_to_ouroboros(code: str):
     try:
-        interpreter = OuroborosInterpreter()
-        results = interpreter.interpret(code)
+        interpreter = _get_interpreter()
+        results = interpreter.execute(_compile(code))
         return results
     except InterpreterError as e:
         Logger.error(f"{e}")
         return []
 
+feed_to_ouroboros.clear_cache = _compile.cache_clear
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -13,6 +13,13 @@ class Matrix:
     def __getitem__(self, row):
         return MatrixRow(self, row)
     
+    def get(self, row, col):
+        """Element access without building a MatrixRow"""
+        return self.data[row * self.cols + col]
+    
+    def set(self, row, col, value):
+        self.data[row * self.cols + col] = value
+    
     def __setitem__(self, row, value):
         start = row * self.cols
         end = start + self.cols
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Iterator, List, Tuple, Optional, Any
 from .errors import RuntimeError
 
 class MemoryBlock:
+    __slots__ = ('address', 'size', 'data', 'allocated')
+    
     def __init__(self, address: int, size: int, data: List[Any] = None):
         self.address = address
         self.size = size
@@ -14,10 +16,28 @@ class MemoryBlock:
         return f"MemoryBlock(addr=0x{self.address:x}, size={self.size}, allocated={self.allocated})"
 
 class MemoryManager:
+    __slots__ = ('heap', 'next_address', 'free_blocks', 'bins', 'address_strings',
+                 'total_allocated', 'allocation_count')
+    
+    ALIGNMENT = 8  # Small requests are rounded up to a multiple of this
+    SMALL_BLOCK_LIMIT = 256  # Largest size served from the size-class bins
+    
     def __init__(self):
         self.heap: Dict[int, MemoryBlock] = {}  # address -> MemoryBlock
         self.next_address = 0x1000  # Starting address of the heap
         self.free_blocks: List[Tuple[int, int]] = []  # (address, size) 
+        self.bins: Dict[int, List[int]] = {}  # size class -> freed addresses
+        self.address_strings: Dict[int, str] = {}  # block address -> "0x%08x", filled in by %p
+        self.total_allocated = 0
+        self.allocation_count = 0
+    
+    def reset(self):
+        """Release every block and return the heap to its initial state"""
+        self.heap.clear()
+        self.next_address = 0x1000
+        self.free_blocks = []
+        self.bins.clear()
+        self.address_strings.clear()
         self.total_allocated = 0
         self.allocation_count = 0
     
@@ -26,13 +46,30 @@ class MemoryManager:
         if size <= 0:
             raise RuntimeError("malloc: Invalid size")
         
-        address = self._find_free_block(size)
-        if address is None:
-            address = self.next_address
-            self.next_address += size
+        size_class = self._size_class(size)
+        if size_class:
+            # Small blocks come back from their bin without a search. Bins are
+            # LIFO, so free followed by malloc of the same size returns the
+            # same address.
+            free_list = self.bins.get(size_class)
+            if free_list:
+                # Reuse the freed block and its storage in place
+                address = free_list.pop()
+                block = self.heap[address]
+                block.data[:] = [0] * size_class
+                block.size = size
+                block.allocated = True
+            else:
+                address = self.next_address
+                self.next_address += size_class
+                self.heap[address] = MemoryBlock(address, size, [0] * size_class)
+        else:
+            address = self._find_free_block(size)
+            if address is None:
+                address = self.next_address
+                self.next_address += size
+            self.heap[address] = MemoryBlock(address, size)
         
-        block = MemoryBlock(address, size)
-        self.heap[address] = block
         self.total_allocated += size
         self.allocation_count += 1
         
@@ -50,8 +87,12 @@ class MemoryManager:
         block.allocated = False
         self.total_allocated -= block.size
         
-        self.free_blocks.append((address, block.size))
-        self._coalesce_free_blocks()
+        size_class = self._size_class(block.size)
+        if size_class:
+            self.bins.setdefault(size_class, []).append(address)
+        else:
+            self.free_blocks.append((address, block.size))
+            self._coalesce_free_blocks()
         
         return True
     
@@ -72,6 +113,14 @@ class MemoryManager:
         if not old_block.allocated:
             raise RuntimeError(f"realloc: Address already freed 0x{address:x}")
         
+        # Still fits the same size class: resize without moving
+        size_class = self._size_class(new_size)
+        if size_class and size_class == self._size_class(old_block.size):
+            old_block.data[old_block.size:new_size] = [0] * max(0, new_size - old_block.size)
+            self.total_allocated += new_size - old_block.size
+            old_block.size = new_size
+            return address
+        
         new_address = self.malloc(new_size)
         new_block = self.heap[new_address]
         
@@ -84,10 +133,10 @@ class MemoryManager:
     
     def read_memory(self, address: int, offset: int = 0) -> Any:
         """Reads data from the specified address & offset."""
-        if address not in self.heap:
+        block = self.heap.get(address)
+        if block is None:
             raise RuntimeError(f"read_memory: Invalid address 0x{address:x}")
         
-        block = self.heap[address]
         if not block.allocated:
             raise RuntimeError(f"read_memory: Reading from freed memory 0x{address:x}")
         
@@ -98,10 +147,10 @@ class MemoryManager:
     
     def write_memory(self, address: int, offset: int, value: Any) -> bool:
         """Writes data to the specified address & offset."""
-        if address not in self.heap:
+        block = self.heap.get(address)
+        if block is None:
             raise RuntimeError(f"write_memory: Invalid address 0x{address:x}")
         
-        block = self.heap[address]
         if not block.allocated:
             raise RuntimeError(f"write_memory: Writing to freed memory 0x{address:x}")
         
@@ -111,6 +160,37 @@ class MemoryManager:
         block.data[offset] = value
         return True
     
+    def read_string(self, address: int, offset: int = 0) -> str:
+        """Reads a null-terminated string starting at address & offset."""
+        block = self._get_allocated_block(address, "read_string")
+        data = block.data[offset:block.size]
+        try:
+            end = data.index(0)
+        except ValueError:
+            raise RuntimeError(f"read_string: Missing null terminator in block 0x{address:x}")
+        
+        return "".join(chr(char) if isinstance(char, int) else str(char) for char in data[:end])
+    
+    def write_values(self, address: int, offset: int, values: List[Any]) -> bool:
+        """Writes consecutive values starting at address & offset."""
+        block = self._get_allocated_block(address, "write_values")
+        end = offset + len(values)
+        if offset < 0 or end > block.size:
+            raise RuntimeError(f"write_values: Range {offset}..{end} out of bounds for block size {block.size}")
+        
+        block.data[offset:end] = values
+        return True
+    
+    def _get_allocated_block(self, address: int, caller: str) -> MemoryBlock:
+        block = self.heap.get(address)
+        if block is None:
+            raise RuntimeError(f"{caller}: Invalid address 0x{address:x}")
+        
+        if not block.allocated:
+            raise RuntimeError(f"{caller}: Accessing freed memory 0x{address:x}")
+        
+        return block
+    
     def get_block_size(self, address: int) -> int:
         """Gets the block size of the specified address."""
         if address not in self.heap:
@@ -133,9 +213,16 @@ class MemoryManager:
             'allocated_blocks': allocated_blocks,
             'free_blocks_count': len(self.free_blocks),
             'free_blocks_size': free_blocks_size,
+            'binned_blocks': sum(len(free_list) for free_list in self.bins.values()),
             'heap_size': len(self.heap)
         }
     
+    def _size_class(self, size: int) -> int:
+        """Size class of a small block, or 0 if it is too large to bin"""
+        if size > self.SMALL_BLOCK_LIMIT:
+            return 0
+        return (size + self.ALIGNMENT - 1) & -self.ALIGNMENT
+    
     def _find_free_block(self, size: int) -> Optional[int]:
         """Find a free block that fits the specified size"""
         for i, (address, block_size) in enumerate(self.free_blocks):
@@ -174,18 +261,25 @@ class MemoryManager:
     
     def debug_dump(self) -> str:
         """デバッグ用のメモリダンプ"""
-        lines = ["=== Memory Dump ==="]
-        lines.append(f"Total allocated: {self.total_allocated} bytes")
-        lines.append(f"Allocation count: {self.allocation_count}")
-        lines.append(f"Free blocks: {len(self.free_blocks)}")
+        return "\n".join(self.iter_debug_dump())
+    
+    def iter_debug_dump(self) -> Iterator[str]:
+        """メモリダンプを一行ずつ生成する"""
+        yield "=== Memory Dump ==="
+        yield f"Total allocated: {self.total_allocated} bytes"
+        yield f"Allocation count: {self.allocation_count}"
+        yield f"Free blocks: {len(self.free_blocks)}"
         
-        lines.append("\nAllocated blocks:")
+        yield "\nAllocated blocks:"
         for address, block in self.heap.items():
             if block.allocated:
-                lines.append(f"  0x{address:08x}: {block.size} bytes")
+                yield f"  0x{address:08x}: {block.size} bytes"
         
-        lines.append("\nFree blocks:")
+        yield "\nFree blocks:"
         for address, size in self.free_blocks:
-            lines.append(f"  0x{address:08x}: {size} bytes")
+            yield f"  0x{address:08x}: {size} bytes"
         
-        return "\n".join(lines)
\ No newline at end of file
+        yield "\nBinned blocks:"
+        for size_class, free_list in sorted(self.bins.items()):
+            for address in free_list:
+                yield f"  0x{address:08x}: {size_class} bytes"
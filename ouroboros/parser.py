@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
-from typing import Optional, Tuple
+import sys
+from typing import Any, Dict, Optional, Tuple
 from .lexer import Lexer, TokenType
 from .ast_nodes import *
 from .errors import ParserError
@@ -9,6 +10,17 @@ class Parser:
     def __init__(self, lexer: Lexer):
         self.lexer = lexer
         self.current_token = self.lexer.get_next_token()
+        self.constants: Dict[Tuple[type, Any], Literal] = {}  # constant pool
+    
+    def constant(self, value: Any) -> Literal:
+        """Shared Literal node for a constant; strings are interned"""
+        key = (type(value), value)
+        node = self.constants.get(key)
+        if node is None:
+            if isinstance(value, str):
+                value = sys.intern(value)
+            node = self.constants[key] = Literal(value)
+        return node
     
     def error(self, message: str):
         line = self.current_token.line if self.current_token else 0
@@ -349,10 +361,40 @@ class Parser:
             self.eat(TokenType.LOGICAL_OR)
             self.skip_newlines()
             right = self.logical_and()
-            node = BinaryOp(node, token.type, right)
+            node = self._fold_membership(node, right) or BinaryOp(node, token.type, right)
         
         return node
     
+    def _fold_membership(self, left: Expression, right: Expression) -> Optional[MembershipTest]:
+        """Fold `x == c1 || x == c2` (integer constants) into one MembershipTest"""
+        right_match = self._constant_equality(right)
+        if right_match is None:
+            return None
+        
+        name, value = right_match
+        if isinstance(left, MembershipTest):
+            if left.operand.name == name:
+                return MembershipTest(left.operand, left.values | {value})
+            return None
+        
+        left_match = self._constant_equality(left)
+        if left_match is None or left_match[0] != name:
+            return None
+        return MembershipTest(Identifier(name), frozenset((left_match[1], value)))
+    
+    @staticmethod
+    def _constant_equality(node: Expression) -> Optional[Tuple[str, int]]:
+        """(name, value) if node is `name == integer` in either order"""
+        if not isinstance(node, BinaryOp) or node.op != TokenType.EQUAL:
+            return None
+        
+        left, right = node.left, node.right
+        if isinstance(left, Literal):
+            left, right = right, left
+        if isinstance(left, Identifier) and isinstance(right, Literal) and type(right.value) is int:
+            return left.name, right.value
+        return None
+    
     def logical_and(self) -> Expression:
         node = self.equality()
         
@@ -445,12 +487,12 @@ class Parser:
                 while self.current_token.type == TokenType.MULTIPLY:
                     self.eat(TokenType.MULTIPLY)
                 self.eat(TokenType.RPAREN)
-                return Literal(4)  # 簡単のため、すべて4バイトとする
+                return self.constant(4)  # 簡単のため、すべて4バイトとする
             else:
                 # sizeof(expression)
                 expr = self.expression()
                 self.eat(TokenType.RPAREN)
-                return Literal(4)  # 簡単のため、すべて4バイトとする
+                return self.constant(4)  # 簡単のため、すべて4バイトとする
         
         return self.postfix()
     
@@ -504,15 +546,15 @@ class Parser:
         if token.type == TokenType.NUMBER:
             self.eat(TokenType.NUMBER)
             value = float(token.value) if '.' in token.value else int(token.value)
-            return Literal(value)
+            return self.constant(value)
         
         elif token.type == TokenType.STRING:
             self.eat(TokenType.STRING)
-            return Literal(token.value)
+            return self.constant(token.value)
         
         elif token.type == TokenType.CHAR:
             self.eat(TokenType.CHAR)
-            return Literal(ord(token.value))
+            return self.constant(ord(token.value))
         
         elif token.type == TokenType.IDENTIFIER:
             self.eat(TokenType.IDENTIFIER)
@@ -1,11 +1,34 @@
 #!/usr/bin/env python3
 
-from typing import List, Any
+import sys
+from typing import Dict, List, Tuple, Any
 from .memory import MemoryManager
 
 class StandardLibrary:
+    # printf output for a conversion whose argument is missing
+    _MISSING_ARGUMENT = {'d': '0', 'f': '0.0', 'c': '\0', 's': '', 'p': '0x00000000'}
+    _output_limit = 65536  # Buffered characters before output is written early
+    
     def __init__(self, memory_manager: MemoryManager=None):
         self.memory_manager = memory_manager
+        self._output: List[str] = []  # Program output not yet written to stdout
+        self._output_size = 0
+        # Set by OuroborosInterpreter.execute for the length of a run; standalone
+        # calls (printf, puts, ...) write their output immediately
+        self.buffer_output = False
+        self._format_plans: Dict[str, List[Tuple[str, str]]] = {}  # format string -> parsed plan
+        # printf conversions, keyed by spec and then by argument type
+        self._converters = {
+            'd': lambda val: str(int(val)),
+            'f': lambda val: str(float(val)),
+            'c': self._convert_char,
+            's': self._convert_string,
+            'p': self._convert_pointer,
+        }
+        self._string_converters = {
+            list: self._char_array_to_string,
+            int: self._heap_string,
+        }
         self.functions = {
             'printf': self.printf,
             'scanf': self.scanf,
@@ -14,6 +37,7 @@ class StandardLibrary:
             'strlen': self.strlen,
             'strcpy': self.strcpy,
             'strcmp': self.strcmp,
+            'strchr': self.strchr,
             'malloc': self.malloc,
             'free': self.free,
             'realloc': self.realloc,
@@ -24,87 +48,113 @@ class StandardLibrary:
             return 0
         
         format_str = str(args[0])
+
+        # Fast path: nothing to format
+        if '%' not in format_str:
+            self.write(format_str)
+            return 0
+
+        plan = self._format_plans.get(format_str)
+        if plan is None:
+            plan = self._format_plans[format_str] = self._parse_format(format_str)
+        
         arg_index = 1
         
-        result = ""
+        parts = []
+        for literal, spec in plan:
+            parts.append(literal)
+            if spec:
+                if arg_index < len(args):
+                    parts.append(self._converters[spec](args[arg_index]))
+                    arg_index += 1
+                else:
+                    parts.append(self._MISSING_ARGUMENT[spec])
+        
+        self.write("".join(parts))
+        return 0
+    
+    def write(self, text: str):
+        """Queue program output; unless buffering, it is written right away"""
+        self._output.append(text)
+        self._output_size += len(text)
+        if not self.buffer_output or self._output_size >= self._output_limit:
+            self.flush_output()
+    
+    def flush_output(self):
+        """Write all queued program output to stdout in a single call"""
+        if self._output:
+            sys.stdout.write("".join(self._output))
+            self._output.clear()
+            self._output_size = 0
+    
+    def _convert_char(self, val: Any) -> str:
+        return chr(val) if type(val) is int else str(val)
+    
+    def _convert_string(self, val: Any) -> str:
+        convert = self._string_converters.get(type(val))
+        return convert(val) if convert else str(val)
+    
+    def _convert_pointer(self, val: Any) -> str:
+        if type(val) is not int:
+            return str(val)
+        if not self.memory_manager:
+            return f"0x{val:08x}"
+        
+        # Heap addresses are formatted on first use and reused after that
+        address_strings = self.memory_manager.address_strings
+        formatted = address_strings.get(val)
+        if formatted is None:
+            formatted = f"0x{val:08x}"
+            if val in self.memory_manager.heap:
+                address_strings[val] = formatted
+        return formatted
+    
+    def _char_array_to_string(self, val: List[Any]) -> str:
+        # null-terminated char array
+        chars = []
+        for char in val:
+            if char == 0:
+                break
+            chars.append(chr(char) if isinstance(char, int) else str(char))
+        return "".join(chars)
+    
+    def _heap_string(self, val: int) -> str:
+        if not self.memory_manager:
+            return str(val)
+        try:
+            return self.memory_manager.read_string(val)
+        except:
+            return f"0x{val:08x}"
+    
+    @staticmethod
+    def _parse_format(format_str: str) -> List[Tuple[str, str]]:
+        """Split a format string into (literal text, conversion) pairs"""
+        plan = []
+        literal = ""
         i = 0
         while i < len(format_str):
             if format_str[i] == '%' and i + 1 < len(format_str):
                 spec = format_str[i + 1]
-                if spec == 'd':
-                    if arg_index < len(args):
-                        result += str(int(args[arg_index]))
-                        arg_index += 1
-                    else:
-                        result += '0'
-                elif spec == 'f':
-                    if arg_index < len(args):
-                        result += str(float(args[arg_index]))
-                        arg_index += 1
-                    else:
-                        result += '0.0'
-                elif spec == 'c':
-                    if arg_index < len(args):
-                        val = args[arg_index]
-                        if isinstance(val, int):
-                            result += chr(val)
-                        else:
-                            result += str(val)
-                        arg_index += 1
-                    else:
-                        result += '\0'
-                elif spec == 's':
-                    if arg_index < len(args):
-                        val = args[arg_index]
-                        if isinstance(val, list):
-                            # char array to string
-                            char_str = ""
-                            for char in val:
-                                if char == 0:
-                                    break
-                                char_str += chr(char) if isinstance(char, int) else str(char)
-                            result += char_str
-                        elif isinstance(val, int) and self.memory_manager:
-                            try:
-                                char_str = ""
-                                offset = 0
-                                while True:
-                                    char = self.memory_manager.read_memory(val, offset)
-                                    if char == 0:
-                                        break
-                                    char_str += chr(char) if isinstance(char, int) else str(char)
-                                    offset += 1
-                                result += char_str
-                            except:
-                                result += f"0x{val:08x}"
-                        else:
-                            result += str(val)
-                        arg_index += 1
-                    else:
-                        result += ''
-                elif spec == 'p':
-                    if arg_index < len(args):
-                        val = args[arg_index]
-                        if isinstance(val, int):
-                            result += f"0x{val:08x}"
-                        else:
-                            result += str(val)
-                        arg_index += 1
-                    else:
-                        result += '0x00000000'
+                if spec in 'dfcsp':
+                    plan.append((literal, spec))
+                    literal = ""
                 elif spec == '%':
-                    result += '%'
+                    literal += '%'
                 else:
-                    result += format_str[i:i+2]
+                    literal += format_str[i:i+2]
                 i += 2
             else:
-                result += format_str[i]
+                literal += format_str[i]
                 i += 1
         
-        print(result, end='')
-        return 0
+        if literal:
+            plan.append((literal, ''))
+        return plan
     
     def scanf(self, args: List[Any]) -> int:
+        # Show any pending prompt before waiting for input
+        self.flush_output()
+        sys.stdout.flush()
         try:
             user_input = input()
             if user_input.isdigit() or (user_input.startswith('-') and user_input[1:].isdigit()):
@@ -119,12 +169,14 @@ class StandardLibrary:
     
     def puts(self, args: List[Any]) -> int:
         if args:
-            print(str(args[0]))
+            self.write(str(args[0]) + "\n")
         else:
-            print()
+            self.write("\n")
         return 0
     
     def gets(self, args: List[Any]) -> str:
+        self.flush_output()
+        sys.stdout.flush()
         try:
             return input()
         except:
@@ -143,13 +195,7 @@ class StandardLibrary:
                 return len(arg)
             elif isinstance(arg, int) and self.memory_manager:
                 try:
-                    length = 0
-                    while True:
-                        char = self.memory_manager.read_memory(arg, length)
-                        if char == 0:
-                            break
-                        length += 1
-                    return length
+                    return len(self.memory_manager.read_string(arg))
                 except:
                     return 0
         return 0
@@ -160,23 +206,17 @@ class StandardLibrary:
             src = args[1]
             
             if isinstance(dest, int) and self.memory_manager:
+                if isinstance(src, int):
+                    src = self.memory_manager.read_string(src)
+                
                 if isinstance(src, str):
-                    for i, char in enumerate(src):
-                        self.memory_manager.write_memory(dest, i, ord(char))
-                    self.memory_manager.write_memory(dest, len(src), 0)  # null terminator
+                    values = [ord(char) for char in src]
+                    values.append(0)  # null terminator
+                    self.memory_manager.write_values(dest, 0, values)
                 elif isinstance(src, list):
-                    for i, char in enumerate(src):
-                        self.memory_manager.write_memory(dest, i, char)
-                        if char == 0:
-                            break
-                elif isinstance(src, int) and self.memory_manager:
-                    offset = 0
-                    while True:
-                        char = self.memory_manager.read_memory(src, offset)
-                        self.memory_manager.write_memory(dest, offset, char)
-                        if char == 0:
-                            break
-                        offset += 1
+                    # copy up to and including the null terminator
+                    end = src.index(0) + 1 if 0 in src else len(src)
+                    self.memory_manager.write_values(dest, 0, src[:end])
                 return dest
             else:
                 return str(src) if src else ""
@@ -195,6 +235,23 @@ class StandardLibrary:
                 return 0
         return 0
     
+    def strchr(self, args: List[Any]) -> Any:
+        if len(args) >= 2:
+            string = self._get_string_value(args[0])
+            char = args[1]
+            char = chr(char) if isinstance(char, int) else str(char)[:1]
+            
+            # The terminator itself is part of the string in C; [0] is an
+            # empty char array, which is still a non-NULL result
+            if char == '\0':
+                return [0]
+            
+            index = string.find(char)
+            if index >= 0:
+                # No pointer into the source here; hand back the matching tail
+                return string[index:]
+        return 0
+    
     def malloc(self, args: List[Any]) -> int:
         if not args or not self.memory_manager:
             return 0
@@ -204,7 +261,7 @@ class StandardLibrary:
             address = self.memory_manager.malloc(size)
             return address
         except Exception as e:
-            print(f"malloc error: {e}")
+            self.write(f"malloc error: {e}\n")
             return 0
     
     def free(self, args: List[Any]) -> int:
@@ -218,7 +275,7 @@ class StandardLibrary:
             self.memory_manager.free(address)
             return 0
         except Exception as e:
-            print(f"free error: {e}")
+            self.write(f"free error: {e}\n")
             return -1
     
     def realloc(self, args: List[Any]) -> int:
@@ -237,24 +294,10 @@ class StandardLibrary:
         if isinstance(arg, str):
             return arg
         elif isinstance(arg, list):
-            # null-terminated char array
-            result = ""
-            for char in arg:
-                if char == 0:
-                    break
-                result += chr(char) if isinstance(char, int) else str(char)
-            return result
+            return self._char_array_to_string(arg)
         elif isinstance(arg, int) and self.memory_manager:
             try:
-                result = ""
-                offset = 0
-                while True:
-                    char = self.memory_manager.read_memory(arg, offset)
-                    if char == 0:
-                        break
-                    result += chr(char) if isinstance(char, int) else str(char)
-                    offset += 1
-                return result
+                return self.memory_manager.read_string(arg)
             except:
                 return ""
         else:
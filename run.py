@@ -4,91 +4,151 @@
 Touch Off Program for Ouroboros
 """
 
+import contextlib
+import io
+import os
+import signal
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from ouroboros import feed_to_ouroboros, Logger, Style
 from sample_programs import SampleProgramManager, SampleProgram, ProgramCategory
 
-def execute_c_program(program: SampleProgram):
+_CATEGORY_EMOJI: Dict[ProgramCategory, str] = {
+    ProgramCategory.BASIC: "📔",
+    ProgramCategory.CONTROL_FLOW: "📖",
+    ProgramCategory.FUNCTIONS: "📕",
+    ProgramCategory.ARRAYS: "📘",
+    ProgramCategory.STRINGS: "📗",
+    ProgramCategory.MEMORY: "💾",
+    ProgramCategory.ALGORITHMS: "🧮",
+    ProgramCategory.ADVANCED: "🎓"
+}
+
+_STARS: Tuple[str, ...] = ("", "⭐", "⭐⭐", "⭐⭐⭐", "⭐⭐⭐⭐", "⭐⭐⭐⭐⭐")
+
+def _stars(difficulty: int) -> str:
+    """Star rating for a difficulty, prebuilt for the usual 0-5 range"""
+    if 0 <= difficulty < len(_STARS):
+        return _STARS[difficulty]
+    return "⭐" * difficulty
+
+def _exec_and_report(code: str) -> List[Any]:
+    """Run code through Ouroboros, reporting any error instead of raising"""
+    try:
+        return feed_to_ouroboros(code)
+    except Exception as e:
+        Logger.error(f"Execution error: {e}")
+        return []
+
+def _exec_captured(code: str) -> str:
+    """Run code in a worker process, returning its captured output"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        _exec_and_report(code)
+        Logger.flush()
+    return buffer.getvalue()
+
+def execute_c_program(program: SampleProgram, execution: Optional[Future] = None):
     
     Logger.section_start(f"{program.title} Execution")
 
+    info_lines = []
     if program.category:
-        Logger.print(f"📋 Category: {program.category.value}")
+        info_lines.append(f"📋 Category: {program.category.value}")
     if program.difficulty:
-        Logger.print(f"⭐ Difficulty: {'⭐' * program.difficulty}")
+        info_lines.append(f"⭐ Difficulty: {_stars(program.difficulty)}")
     if program.description:
-        Logger.print(f"📄 Description: {program.description}")
+        info_lines.append(f"📄 Description: {program.description}")
     if program.notes:
-        Logger.print(f"📝 Notes: {program.notes}")
+        info_lines.append(f"📝 Notes: {program.notes}")
+    if info_lines:
+        Logger.print("\n".join(info_lines))
     
     Logger.divider("📄 Source Code:")
-    Logger.print(program.code)
+    Logger.print_raw(program.code)
 
-    if program.expected_output:
-        Logger.divider("📋 Expected Output:")
-        Logger.print(program.expected_output.replace('\\n', '\n'))
+    if program.expected_output_rendered:
+        Logger.block("📋 Expected Output:", program.expected_output_rendered)
     
     Logger.divider("🚀 Execution Result:")
-    try:
-        feed_to_ouroboros(program.code)
-    
-    except Exception as e:
-        Logger.error(f"Execution error: {e}")
+    if execution is None:
+        _exec_and_report(program.code)
+    else:
+        try:
+            Logger.write_raw(execution.result())
+        except Exception as e:
+            # A failed worker only affects its own program
+            Logger.error(f"Execution error: {e}")
     
     Logger.print("")
     Logger.section_end(f"{program.title} Completed")
 
-def show_sample_programs(manager: SampleProgramManager):
+def show_sample_programs(programs: Tuple[SampleProgram, ...]):
     """Display all available sample programs"""
     Logger.header("📝 Available Sample Programs")
     
-    programs = manager.get_all_programs()
     for i, program in enumerate(programs, 1):
-        difficulty_stars = "⭐" * program.difficulty
-        category_emoji = {
-            ProgramCategory.BASIC: "📔",
-            ProgramCategory.CONTROL_FLOW: "📖",
-            ProgramCategory.FUNCTIONS: "📕",
-            ProgramCategory.ARRAYS: "📘",
-            ProgramCategory.STRINGS: "📗",
-            ProgramCategory.MEMORY: "💾",
-            ProgramCategory.ALGORITHMS: "🧮",
-            ProgramCategory.ADVANCED: "🎓"
-        }.get(program.category, "📋")
+        difficulty_stars = _stars(program.difficulty)
+        category_emoji = _CATEGORY_EMOJI.get(program.category, "📋")
         
-        Logger.print(f"{i:2d}. {category_emoji} {program.title} | {difficulty_stars}")
-        Logger.print(f"  | {program.category.value}")
-        Logger.print(f"  | {program.description}")
-        Logger.print("")
+        Logger.print("\n".join([
+            f"{i:2d}. {category_emoji} {program.title} | {difficulty_stars}",
+            f"  | {program.category.value}",
+            f"  | {program.description}",
+            "",
+        ]))
 
-def run_all_programs(manager: SampleProgramManager):
-    """Execute all sample programs sequentially"""
-    programs = manager.get_all_programs()
+def _ignore_sigint():
+    """Pool worker initializer: Ctrl+C is handled by the main process only"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
 
+def run_all_programs(programs: Tuple[SampleProgram, ...], pause_between: bool = True):
+    """Execute all sample programs in order; without pauses they are interpreted in parallel"""
+    executor = None
+    
     try:
-        for i, program in enumerate(programs, 1):
+        if pause_between:
+            # Step through one at a time so stopping early skips the rest
+            executions: List[Optional[Future]] = [None] * len(programs)
+        else:
+            # Forked workers must not inherit queued output
+            Logger.flush()
+            executor = ProcessPoolExecutor(initializer=_ignore_sigint)
+            executions = [executor.submit(_exec_captured, program.code) for program in programs]
+        
+        for i, (program, execution) in enumerate(zip(programs, executions), 1):
             Logger.header(f"🔄 Execute All Sample Programs ({i}/{len(programs)})")
-            execute_c_program(program)
+            execute_c_program(program, execution)
             
             # Confirm before proceeding to next program
-            if i < len(programs):
-                input(f"\nPress {Style.GREEN}Enter{Style.RESET} to continue / Press {Style.GREEN}Ctrl + C{Style.RESET} to stop")
+            if pause_between and i < len(programs):
+                Logger.input(f"\nPress {Style.GREEN}Enter{Style.RESET} to continue / Press {Style.GREEN}Ctrl + C{Style.RESET} to stop")
     
     except KeyboardInterrupt:
         Logger.print("")
         Logger.info("Exiting interactive mode")
     except Exception as e:
         Logger.error(f"{e}")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
-def run_selected_program(manager: SampleProgramManager, program_index: int):
+def run_selected_program(programs: Tuple[SampleProgram, ...], program_index: int):
     """Execute the program at the specified index"""
-    programs = manager.get_all_programs()
+    # Negative indices would silently wrap around, so reject them up front
+    if program_index < 1:
+        Logger.error("Invalid program number")
+        return
     
     try:
-        if 1 <= program_index <= len(programs):
-            program = programs[program_index - 1]
-            execute_c_program(program)
-        else:
-            Logger.error("Invalid program number")
+        program = programs[program_index - 1]
+    except IndexError:
+        Logger.error("Invalid program number")
+        return
+    
+    try:
+        execute_c_program(program)
 
     except Exception as e:
         Logger.error(f"{e}")
@@ -96,7 +156,7 @@ def run_selected_program(manager: SampleProgramManager, program_index: int):
 
 def load_c_file(filename: str) -> str:
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
+        with open(filename, 'r', encoding='utf-8', buffering=32768) as f:
             return f.read()
     except FileNotFoundError:
         Logger.error(f"File '{filename}' not found")
@@ -108,7 +168,7 @@ def load_c_file(filename: str) -> str:
 def load_and_run_file():
     """Load and execute a file"""
     Logger.header("📁 File Execution Mode")
-    filepath = input("Enter C file path to execute: ").strip()
+    filepath = Logger.input("Enter C file path to execute: ").strip()
     
     if not filepath:
         Logger.error("No filepath entered")
@@ -123,6 +183,24 @@ def load_and_run_file():
             )
         )
 
+def _read_stdin_line() -> str:
+    """Read one line of continuation input, returning '' on EOF"""
+    if os.name != 'posix' or not sys.stdin.isatty():
+        return sys.stdin.readline()
+    
+    # A terminal in canonical mode hands over at most one line per read,
+    # so this never consumes input past the current line
+    fd = sys.stdin.fileno()
+    chunks = []
+    while True:
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            break
+    return b"".join(chunks).decode('utf-8', errors='replace')
+
 def interactive_mode():
     """Execute C code in interactive mode"""
     Logger.header("💻 Interactive Mode")
@@ -134,13 +212,20 @@ def interactive_mode():
         try:
             lines = []
             
+            # First line goes through input() to keep line editing,
+            # the rest of a (possibly pasted) block is read directly
+            line = Logger.input("ouroboros> ")
             while True:
-                line = input("ouroboros> ")
                 if line.strip().lower() == 'exit':
                     return
                 if not line.strip() and lines:  # Empty line ends input
                     break
                 lines.append(line)
+                
+                line = _read_stdin_line()
+                if not line:  # EOF ends input
+                    break
+                line = line.rstrip('\n')
             
             if lines:
                 code = '\n'.join(lines)
@@ -162,35 +247,46 @@ def main():
     manager = SampleProgramManager()
     Logger.title()
     
+    programs = manager.get_all_programs()
+    n_programs = manager.get_program_count()
+    
+    menu = "\n".join([
+        "",
+        f"- {Style.BOLD}{Style.BLUE}{n_programs}{Style.RESET}{Style.WHITE} Sample Programs Available -",
+        "",
+        "1. Execute All Sample Programs",
+        "1b. Execute All Sample Programs (no pause)",
+        "2. Execute Specific Sample Program",
+        "3. Execute C file",
+        "4. Execute in Interactive Mode",
+        "5. Exit",
+    ])
+    
     while True:
-        Logger.print("")
-        Logger.print(f"- {Style.BOLD}{Style.BLUE}{manager.get_program_count()}{Style.RESET} Sample Programs Available -")
-        Logger.print("")
-        Logger.print("1. Execute All Sample Programs")
-        Logger.print("2. Execute Specific Sample Program")
-        Logger.print("3. Execute C file")
-        Logger.print("4. Execute in Interactive Mode")
-        Logger.print("5. Exit")
+        Logger.print(menu)
         
         try:
-            choice = input(f"\nPlease select {Style.GREEN}(1-5){Style.RESET}: ").strip()
+            choice = Logger.input(f"\nPlease select {Style.GREEN}(1, 1b, 2-5){Style.RESET}: ").strip()
             
             if choice == "1":
-                confirm = input(f"Execute all sample programs? {Style.YELLOW}(y/n){Style.RESET}: ").strip().lower()
+                confirm = Logger.input(f"Execute all sample programs? {Style.YELLOW}(y/n){Style.RESET}: ").strip().lower()
                 if confirm in ['y', 'yes']:
-                    run_all_programs(manager)
+                    run_all_programs(programs)
                 else:
                     Logger.info("Cancelled")
 
+            elif choice == "1b":
+                run_all_programs(programs, pause_between=False)
+
             elif choice == "2":
-                show_sample_programs(manager)
+                show_sample_programs(programs)
                 try:
-                    program_num = int(input(f"\nSelect program number to execute {Style.GREEN}(1-{manager.get_program_count()}){Style.RESET}: "))
-                    run_selected_program(manager, program_num)
-                    input(f"\nPress {Style.GREEN}Enter{Style.RESET} to return...")
+                    program_num = int(Logger.input(f"\nSelect program number to execute {Style.GREEN}(1-{n_programs}){Style.RESET}: "))
+                    run_selected_program(programs, program_num)
+                    Logger.input(f"\nPress {Style.GREEN}Enter{Style.RESET} to return...")
                 except ValueError:
                     Logger.error("Invalid number")
-                    input(f"\nPress {Style.GREEN}Enter{Style.RESET} to return...")
+                    Logger.input(f"\nPress {Style.GREEN}Enter{Style.RESET} to return...")
 
             elif choice == "3":
                 load_and_run_file()
@@ -203,7 +299,7 @@ def main():
                 break
                 
             else:
-                Logger.error(f"Invalid selection. Please enter a number {Style.GREEN}1-5{Style.RESET}")
+                Logger.error(f"Invalid selection. Please enter {Style.GREEN}1, 1b or 2-5{Style.RESET}")
         
         except KeyboardInterrupt:
             Logger.print("")
@@ -211,7 +307,7 @@ def main():
             break
         except Exception as e:
             Logger.error(f"{e}")
-            input(f"\nPress {Style.GREEN}Enter{Style.RESET} to return...")
+            Logger.input(f"\nPress {Style.GREEN}Enter{Style.RESET} to return...")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
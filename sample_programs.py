@@ -4,8 +4,9 @@
 Sample Programs for Ouroboros
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import List, Dict, Optional, Tuple
 from enum import Enum
 
 class ProgramCategory(Enum):
@@ -18,7 +19,7 @@ class ProgramCategory(Enum):
     ALGORITHMS = "Mathematical Algorithms"
     ADVANCED = "Advanced Features"
 
-@dataclass
+@dataclass(slots=True)
 class SampleProgram:
     title: str
     code: str
@@ -27,18 +28,27 @@ class SampleProgram:
     difficulty: Optional[int] = None
     expected_output: Optional[str] = None
     notes: Optional[str] = None
+    id: Optional[str] = None
+    expected_output_rendered: Optional[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Resolve escaped newlines once instead of on every view
+        self.expected_output_rendered = (
+            self.expected_output.replace('\\n', '\n') if self.expected_output else None
+        )
 
 class SampleProgramManager:
-    def __init__(self):
-        self.programs: List[SampleProgram] = []
-        self._load_programs()
+    @cached_property
+    def programs(self) -> Tuple[SampleProgram, ...]:
+        """All sample programs, built on first access"""
+        return self._load_programs()
     
-    def _load_programs(self):
+    def _load_programs(self) -> Tuple[SampleProgram, ...]:
         """Load all sample programs"""
-        
-        # Basic Programming
-        self.programs.extend([
+        return (
+            # Basic Programming
             SampleProgram(
+                id="basic_hello_world",
                 title="Hello World",
                 description="Basic printf output",
                 category=ProgramCategory.BASIC,
@@ -51,6 +61,7 @@ class SampleProgramManager:
             ),
             
             SampleProgram(
+                id="basic_variables",
                 title="Variable Declaration and Operations",
                 description="Basic variable operations and arithmetic",
                 category=ProgramCategory.BASIC,
@@ -68,11 +79,10 @@ class SampleProgramManager:
 }''',
                 expected_output="x = 5, y = 10\na = 10, b = 20, c = 30\n"
             ),
-        ])
-        
-        # Control Flow
-        self.programs.extend([
+            
+            # Control Flow
             SampleProgram(
+                id="control_conditional",
                 title="Conditional Statements",
                 description="if-else statements and logical operators",
                 category=ProgramCategory.CONTROL_FLOW,
@@ -97,6 +107,7 @@ class SampleProgramManager:
             ),
             
             SampleProgram(
+                id="control_for_loop",
                 title="For Loop",
                 description="Basic for loop implementation",
                 category=ProgramCategory.CONTROL_FLOW,
@@ -111,6 +122,7 @@ class SampleProgramManager:
             ),
             
             SampleProgram(
+                id="control_while_loop",
                 title="While Loop",
                 description="While loop with counter",
                 category=ProgramCategory.CONTROL_FLOW,
@@ -125,11 +137,10 @@ class SampleProgramManager:
 }''',
                 expected_output="Count: 0\nCount: 1\nCount: 2\n"
             ),
-        ])
-        
-        # Functions
-        self.programs.extend([
+            
+            # Functions
             SampleProgram(
+                id="func_add",
                 title="Function Definition and Call",
                 description="Basic function definition and calling",
                 category=ProgramCategory.FUNCTIONS,
@@ -147,6 +158,7 @@ int main() {
             ),
             
             SampleProgram(
+                id="func_fibonacci",
                 title="Recursive Fibonacci",
                 description="Fibonacci sequence using recursion",
                 category=ProgramCategory.FUNCTIONS,
@@ -168,6 +180,36 @@ int main() {
             ),
             
             SampleProgram(
+                id="func_fibonacci_memo",
+                title="Memoized Fibonacci",
+                description="Fibonacci sequence using recursion with an array cache",
+                category=ProgramCategory.FUNCTIONS,
+                difficulty=4,
+                code='''int memo[32];
+
+int fibonacci(int n) {
+    if (n <= 1) {
+        return n;
+    }
+    if (memo[n] != 0) {
+        return memo[n];
+    }
+    memo[n] = fibonacci(n - 1) + fibonacci(n - 2);
+    return memo[n];
+}
+
+int main() {
+    for (int i = 0; i < 8; i++) {
+        printf("fibonacci(%d) = %d\\n", i, fibonacci(i));
+    }
+    return 0;
+}''',
+                expected_output="fibonacci(0) = 0\nfibonacci(1) = 1\nfibonacci(2) = 1\nfibonacci(3) = 2\nfibonacci(4) = 3\nfibonacci(5) = 5\nfibonacci(6) = 8\nfibonacci(7) = 13\n",
+                notes="Each fibonacci(n) is computed once and cached, so the call count grows linearly instead of exponentially"
+            ),
+            
+            SampleProgram(
+                id="func_factorial",
                 title="Factorial Function",
                 description="Recursive factorial calculation",
                 category=ProgramCategory.FUNCTIONS,
@@ -186,11 +228,10 @@ int main() {
 }''',
                 expected_output="Factorial of 5: 120\n"
             ),
-        ])
-        
-        # Arrays
-        self.programs.extend([
+            
+            # Arrays
             SampleProgram(
+                id="array_operations",
                 title="Array Operations",
                 description="Basic array declaration and manipulation",
                 category=ProgramCategory.ARRAYS,
@@ -209,6 +250,7 @@ int main() {
             ),
             
             SampleProgram(
+                id="array_bubble_sort",
                 title="Bubble Sort Algorithm",
                 description="Sorting array using bubble sort",
                 category=ProgramCategory.ARRAYS,
@@ -242,10 +284,51 @@ int main() {
     
     return 0;
 }''',
-                expected_output="Original array: 64 34 25 12 22 11 \nSorted array: 11 12 22 25 34 64 \n"
+                expected_output="Original array: 64 34 25 12 22 11 \nSorted array: 11 12 22 25 34 64 \n",
+                notes="Kept for illustration; the insertion sort sample produces the same result with less work"
+            ),
+            
+            SampleProgram(
+                id="array_insertion_sort",
+                title="Insertion Sort Algorithm",
+                description="Sorting array using insertion sort",
+                category=ProgramCategory.ARRAYS,
+                difficulty=4,
+                code='''int main() {
+    int arr[6] = {64, 34, 25, 12, 22, 11};
+    int n = 6;
+    
+    printf("Original array: ");
+    for (int i = 0; i < n; i++) {
+        printf("%d ", arr[i]);
+    }
+    printf("\\n");
+    
+    // Insertion sort
+    for (int i = 1; i < n; i++) {
+        int key = arr[i];
+        int j = i - 1;
+        while (j >= 0 && arr[j] > key) {
+            arr[j + 1] = arr[j];
+            j--;
+        }
+        arr[j + 1] = key;
+    }
+    
+    printf("Sorted array: ");
+    for (int i = 0; i < n; i++) {
+        printf("%d ", arr[i]);
+    }
+    printf("\\n");
+    
+    return 0;
+}''',
+                expected_output="Original array: 64 34 25 12 22 11 \nSorted array: 11 12 22 25 34 64 \n",
+                notes="Shifts elements instead of swapping them, doing about half the comparisons of bubble sort on average"
             ),
             
             SampleProgram(
+                id="array_2d_matrix",
                 title="2D Array Matrix",
                 description="Two-dimensional array operations",
                 category=ProgramCategory.ARRAYS,
@@ -271,11 +354,10 @@ int main() {
 }''',
                 expected_output="Matrix:\n1 2 3 \n4 5 6 \n7 8 9 \nDiagonal elements: 1 5 9 \n"
             ),
-        ])
-        
-        # String Processing
-        self.programs.extend([
+            
+            # String Processing
             SampleProgram(
+                id="string_operations",
                 title="String Operations",
                 description="Basic string manipulation",
                 category=ProgramCategory.STRINGS,
@@ -293,6 +375,7 @@ int main() {
             ),
             
             SampleProgram(
+                id="string_vowel_count",
                 title="Vowel Counter",
                 description="Count vowels and consonants in a string",
                 category=ProgramCategory.STRINGS,
@@ -304,8 +387,7 @@ int main() {
     
     for (int i = 0; i < len; i++) {
         char c = str[i];
-        if (c == 'a' || c == 'e' || c == 'i' || c == 'o' || c == 'u' ||
-            c == 'A' || c == 'E' || c == 'I' || c == 'O' || c == 'U') {
+        if (strchr("aeiouAEIOU", c) != 0) {
             vowels++;
         } else if ((c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z')) {
             consonants++;
@@ -319,11 +401,10 @@ int main() {
 }''',
                 expected_output="String: Hello World\nVowels: 3, Consonants: 7\n"
             ),
-        ])
-        
-        # Memory Management
-        self.programs.extend([
+            
+            # Memory Management
             SampleProgram(
+                id="memory_malloc",
                 title="Dynamic Memory Allocation (simulation)",
                 description="Simulate basic malloc and free operations",
                 category=ProgramCategory.MEMORY,
@@ -351,6 +432,7 @@ int main() {
             ),
             
             SampleProgram(
+                id="memory_realloc",
                 title="Memory Reallocation (simulation)",
                 description="Simulate dynamic array expansion with realloc",
                 category=ProgramCategory.MEMORY,
@@ -385,11 +467,10 @@ int main() {
 }''',
                 expected_output="Original array:\narr[0] = 1\narr[1] = 2\narr[2] = 3\nExtended array:\narr[0] = 1\narr[1] = 2\narr[2] = 3\narr[3] = 4\narr[4] = 5\nExtended array freed\n"
             ),
-        ])
-        
-        # Mathematical Algorithms
-        self.programs.extend([
+            
+            # Mathematical Algorithms
             SampleProgram(
+                id="math_prime_check",
                 title="Prime Number Detection",
                 description="Check if numbers are prime",
                 category=ProgramCategory.ALGORITHMS,
@@ -422,6 +503,44 @@ int main() {
             ),
             
             SampleProgram(
+                id="math_sieve_of_eratosthenes",
+                title="Sieve of Eratosthenes",
+                description="Find all primes in a range by crossing out multiples",
+                category=ProgramCategory.ALGORITHMS,
+                difficulty=3,
+                code='''int sieve[21];
+
+int main() {
+    int n = 20;
+    
+    for (int i = 2; i <= n; i++) {
+        sieve[i] = 1;
+    }
+    
+    for (int i = 2; i * i <= n; i++) {
+        if (sieve[i]) {
+            for (int j = i * i; j <= n; j += i) {
+                sieve[j] = 0;
+            }
+        }
+    }
+    
+    printf("Prime numbers up to %d:\\n", n);
+    for (int i = 2; i <= n; i++) {
+        if (sieve[i]) {
+            printf("%d ", i);
+        }
+    }
+    printf("\\n");
+    
+    return 0;
+}''',
+                expected_output="Prime numbers up to 20:\n2 3 5 7 11 13 17 19 \n",
+                notes="O(N log log N); prefer it over per-number trial division when listing every prime in a range"
+            ),
+            
+            SampleProgram(
+                id="math_gcd",
                 title="Greatest Common Divisor",
                 description="Calculate GCD using Euclidean algorithm",
                 category=ProgramCategory.ALGORITHMS,
@@ -448,6 +567,7 @@ int main() {
             ),
 
             SampleProgram(
+                id="math_pascal_triangle",
                 title="Pascal's Triangle Generator",
                 description="Generate Pascal's triangle using mathematical calculations",
                 category=ProgramCategory.ALGORITHMS,
@@ -487,12 +607,11 @@ int main() {
 
 ''',
                 notes="Demonstrates mathematical calculations, nested loops, and pattern generation with proper formatting"
-)
-        ])
-        
-        # Advanced Features
-        self.programs.extend([
+            ),
+            
+            # Advanced Features
             SampleProgram(
+                id="advanced_compound_assign",
                 title="Compound Assignment Operators",
                 description="Demonstration of +=, -=, *=, /= operators",
                 category=ProgramCategory.ADVANCED,
@@ -519,20 +638,25 @@ int main() {
             ),
             
             SampleProgram(
+                id="advanced_complex_logic",
                 title="Complex Logical Operations",
                 description="Complex conditional expressions and character analysis",
                 category=ProgramCategory.ADVANCED,
                 difficulty=3,
-                code='''int main() {
+                code='''int is_vowel[128];
+
+int main() {
     char c = 'E';
     
+    is_vowel['a'] = is_vowel['e'] = is_vowel['i'] = is_vowel['o'] = is_vowel['u'] = 1;
+    is_vowel['A'] = is_vowel['E'] = is_vowel['I'] = is_vowel['O'] = is_vowel['U'] = 1;
+    
     printf("Analyzing character: '%c'\\n", c);
     
     if ((c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z')) {
         printf("'%c' is a letter\\n", c);
         
-        if (c == 'a' || c == 'e' || c == 'i' || c == 'o' || c == 'u' ||
-            c == 'A' || c == 'E' || c == 'I' || c == 'O' || c == 'U') {
+        if (is_vowel[c]) {
             printf("'%c' is a vowel\\n", c);
         } else {
             printf("'%c' is a consonant\\n", c);
@@ -545,40 +669,62 @@ int main() {
 }''',
                 expected_output="Analyzing character: 'E'\n'E' is a letter\n'E' is a vowel\n"
             ),
-        ])
-    
-    def get_all_programs(self) -> List[SampleProgram]:
-        """Get all sample programs"""
+        )
+    
+    @cached_property
+    def _by_id(self) -> Dict[str, SampleProgram]:
+        """Programs indexed by ID"""
+        return {p.id: p for p in self.programs}
+    
+    @cached_property
+    def _by_category(self) -> Dict[ProgramCategory, List[SampleProgram]]:
+        """Programs grouped by category, in load order"""
+        by_category: Dict[ProgramCategory, List[SampleProgram]] = {}
+        for p in self.programs:
+            by_category.setdefault(p.category, []).append(p)
+        return by_category
+    
+    @cached_property
+    def _by_difficulty(self) -> Dict[int, List[SampleProgram]]:
+        """Programs grouped by difficulty level, in load order"""
+        by_difficulty: Dict[int, List[SampleProgram]] = {}
+        for p in self.programs:
+            by_difficulty.setdefault(p.difficulty, []).append(p)
+        return by_difficulty
+    
+    @cached_property
+    def _search_index(self) -> List[Tuple[str, SampleProgram]]:
+        """Lowercased title and description of each program, NUL-separated"""
+        return [(f"{p.title.lower()}\x00{(p.description or '').lower()}", p) for p in self.programs]
+    
+    def get_all_programs(self) -> Tuple[SampleProgram, ...]:
+        """Get all sample programs (an immutable tuple, safe to share)"""
         return self.programs
     
     def get_programs_by_category(self, category: ProgramCategory) -> List[SampleProgram]:
         """Get programs filtered by category"""
-        return [p for p in self.programs if p.category == category]
+        return list(self._by_category.get(category, []))
     
     def get_programs_by_difficulty(self, difficulty: int) -> List[SampleProgram]:
         """Get programs filtered by difficulty level"""
-        return [p for p in self.programs if p.difficulty == difficulty]
+        return list(self._by_difficulty.get(difficulty, []))
     
     def get_program_by_id(self, program_id: str) -> Optional[SampleProgram]:
         """Get a specific program by ID"""
-        for program in self.programs:
-            if program.id == program_id:
-                return program
-        return None
+        return self._by_id.get(program_id)
     
     def get_categories(self) -> List[ProgramCategory]:
         """Get all available categories"""
-        return list(set(p.category for p in self.programs))
+        return list(self._by_category)
     
     def get_difficulty_levels(self) -> List[int]:
         """Get all available difficulty levels"""
-        return sorted(list(set(p.difficulty for p in self.programs)))
+        return sorted(self._by_difficulty)
     
     def search_programs(self, keyword: str) -> List[SampleProgram]:
         """Search programs by keyword in title or description"""
         keyword = keyword.lower()
-        return [p for p in self.programs 
-                if keyword in p.title.lower() or keyword in p.description.lower()]
+        return [p for text, p in self._search_index if keyword in text]
     
     def get_program_count(self) -> int:
         """Get total number of programs"""
@@ -586,7 +732,4 @@ int main() {
     
     def get_program_count_by_category(self) -> Dict[ProgramCategory, int]:
         """Get program count grouped by category"""
-        count_dict = {}
-        for category in self.get_categories():
-            count_dict[category] = len(self.get_programs_by_category(category))
-        return count_dict
+        return {category: len(programs) for category, programs in self._by_category.items()}